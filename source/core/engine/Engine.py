@@ -24,11 +24,19 @@ class Engine:
         pygame.mixer.init(buffer=512)
         pygame.init()
         self.__clock = pygame.time.Clock()
+        self.__frame_time = 1000 / MAX_FPS
+        self.__frame_start = pygame.time.get_ticks()
         self.__game_name = GAME_NAME
         self.__surface = pygame.display.set_mode(
             (WINDOW_WIDTH, WINDOW_HEIGHT), 0, 32)
         pygame.display.set_caption(self.__game_name)
 
+        # Only events handled by the game screens and the ones asking for a
+        # window repaint are queued
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([QUIT, KEYUP, KEYDOWN] +
+                                 list(Match.window_events))
+
         # Loading basic assets
         self.__menu_song = pygame.mixer.Sound("assets/song/menu.ogg")
         self.__game_song = pygame.mixer.Sound("assets/song/game.ogg")
@@ -55,9 +63,7 @@ class Engine:
                     self.__menu_song.play(-1)
 
                     self.__menu = Menu()
-                    del self.__match
                     self.__match = None
-                    del self.__setup
                     self.__setup = None
                 self.__menu.draw(self.__surface)
                 self.__state = self.__menu.update()
@@ -65,7 +71,6 @@ class Engine:
             elif self.__state == STATE_SETUP:
                 if not self.__setup:
                     self.__setup = Setup(self.__sprites)
-                    del self.__menu
                     self.__menu = None
                 self.__setup.draw(self.__surface)
                 self.__state = self.__setup.update()
@@ -78,7 +83,6 @@ class Engine:
 
                     self.__match = Match(self.__setup.get_characters(),
                                          self.__sprites)
-                    del self.__setup
                     self.__setup = None
                 self.__state = self.__match.play(self.__clock, self.__surface)
 
@@ -86,5 +90,22 @@ class Engine:
                 pygame.quit()
                 sys.exit()
 
-            pygame.display.update()
-            self.__clock.tick(MAX_FPS)
+            # During a match only the screen areas that changed are updated
+            if self.__state == STATE_PLAYING and self.__match:
+                pygame.display.update(self.__match.get_dirty_rects())
+            else:
+                pygame.display.update()
+
+            # Sleeps for the rest of the frame, waking up as soon as an event
+            # arrives. Waiting only on an empty queue keeps the events in order
+            # when the received one is put back for the screens to handle.
+            remaining = int(self.__frame_time -
+                            (pygame.time.get_ticks() - self.__frame_start))
+            if remaining > 0 and not pygame.event.peek():
+                event = pygame.event.wait(remaining)
+                if event.type != NOEVENT:
+                    pygame.event.post(event)
+
+            # The clock still measures the frame rate used by the game objects
+            self.__clock.tick()
+            self.__frame_start = pygame.time.get_ticks()
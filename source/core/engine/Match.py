@@ -7,6 +7,7 @@ import time
 
 from source.core.game_objects.bomb.Bomb import Bomb
 from source.core.game_objects.bomb.Fire import Fire
+from source.core.game_objects.character.Character import compile_steering
 from source.core.game_objects.character.Cpu import Cpu
 from source.core.ui.GameOver import GameOver
 from source.core.ui.Map import Map
@@ -21,6 +22,9 @@ class Match:
     user inputs and cpu decisions.
     """
 
+    # Events telling that the window must be repainted
+    window_events = (VIDEOEXPOSE, WINDOWEXPOSED, WINDOWSHOWN, WINDOWRESTORED)
+
     def __init__(self, characters, sprites):
         """
         Default constructor. It assigns initial values to all variables.
@@ -39,6 +43,7 @@ class Match:
 
         # Creating map and game objects
         self.__map = Map(time.time())
+        compile_steering(self.__map.get_grid().get_tilemap())
         self.__players = characters[0]
         self.__cpus = characters[1]
         self.__bombs = list()
@@ -57,6 +62,14 @@ class Match:
         self.__game_over = None
         self.__time_pause = 0
 
+        # Screen areas changed by the current and previous frames. The whole
+        # screen is updated while an overlay is shown, right after it and when
+        # the window asks for a repaint.
+        self.__dirty_rects = list()
+        self.__previous_dirty_rects = list()
+        self.__update_rects = list()
+        self.__full_update = True
+
     def play(self, clock, surface):
         """
         Match loop, which handles different game states.
@@ -66,9 +79,10 @@ class Match:
         """
 
         # Draws map and clock
-        self.__map.draw(surface)
+        self.__dirty_rects = self.__map.draw(surface)
         self.__map.set_is_paused(self.__game_state == Constants.PAUSE or
                                  self.__game_state == Constants.OVER)
+        in_game = self.__game_state == Constants.IN_GAME
 
         # State machine
         if self.__game_state == Constants.PAUSE:
@@ -80,8 +94,24 @@ class Match:
         elif self.__game_state == Constants.MAIN_MENU:
             return Constants.STATE_MENU
 
+        if in_game and not self.__full_update:
+            self.__update_rects = (self.__previous_dirty_rects +
+                                   self.__dirty_rects)
+        else:
+            self.__update_rects = [surface.get_rect()]
+        self.__full_update = not in_game
+        self.__previous_dirty_rects = self.__dirty_rects
+
         return Constants.STATE_PLAYING
 
+    def get_dirty_rects(self):
+        """
+        Getter for the screen areas changed by the last call to play().
+        :return: List of rects to be passed to pygame.display.update().
+        """
+
+        return self.__update_rects
+
     def is_over(self):
         """
         Checks if match is over.
@@ -99,9 +129,12 @@ class Match:
         :return: Match updated state.
         """
         t = time.time()
+        tilemap = self.__map.get_grid().get_tilemap()
 
-        # Handles keyboard events
-        for event in pygame.event.get():
+        # Handles keyboard events. Window events are drained as well, so they
+        # do not stay queued.
+        for event in pygame.event.get((QUIT, KEYUP, KEYDOWN) +
+                                      self.window_events):
             if event.type == QUIT:
                 pygame.quit()
                 sys.exit()
@@ -117,16 +150,20 @@ class Match:
                 for player in self.__players:
                     player.key_down(event.key)
 
+            # The window was uncovered or restored: repaint all of it
+            if event.type in self.window_events:
+                self.__full_update = True
+
         # Decides IA's moves
         for cpu in self.__cpus:
             if cpu.is_alive or cpu.get_reward() != 0:
-                cpu.decide(self.__map.get_grid().get_tilemap(),
+                cpu.decide(tilemap,
                            self.__players + self.__cpus, clock)
 
         # Updates and draws bombs
         for bomb in self.__bombs:
-            if bomb.update(clock, self.__map.get_grid().get_tilemap()):
-                bomb.draw(surface)
+            if bomb.update(clock, tilemap):
+                self.__dirty_rects.append(bomb.draw(surface))
             else:
                 self.__fires.append(Fire(bomb.tile, bomb.range, bomb.id,
                                          self.__sprites['fire']))
@@ -140,8 +177,8 @@ class Match:
 
         # Updates and draws fires
         for fire in self.__fires:
-            if fire.update(clock, self.__map.get_grid().get_tilemap()):
-                fire.draw(surface)
+            if fire.update(clock, tilemap):
+                self.__dirty_rects.append(fire.draw(surface))
                 for tile in fire.get_triggered_bombs():
                     for bomb in self.__bombs:
                         if bomb.tile == tile:
@@ -154,10 +191,10 @@ class Match:
 
         # Updates and draws characters
         for player in self.__players:
-            if not self.__update_character(player, clock, surface):
+            if not self.__update_character(player, clock, surface, tilemap):
                 self.__alive_characters[player.id] = False
         for cpu in self.__cpus:
-            if not self.__update_character(cpu, clock, surface):
+            if not self.__update_character(cpu, clock, surface, tilemap):
                 self.__alive_characters[cpu.id] = False
 
         # Checks if game is over
@@ -176,7 +213,7 @@ class Match:
 
         if self.__game_state == Constants.OVER:
             for cpu in self.__cpus:
-                cpu.decide(self.__map.get_grid().get_tilemap(),
+                cpu.decide(tilemap,
                            self.__players + self.__cpus, clock, True)
 
     def __update_pause_screen(self, surface):
@@ -195,7 +232,6 @@ class Match:
         if self.__game_state == Constants.IN_GAME:
             self.__map.increment_delta_pause(
                 time.time() - self.__time_pause)
-            del self.__pause
             self.__pause = None
 
     def __update_game_over_screen(self, clock, surface):
@@ -209,35 +245,37 @@ class Match:
         if not self.__game_over:
             self.__game_over = GameOver()
 
+        tilemap = self.__map.get_grid().get_tilemap()
+
         # Updates bombs animations
         for bomb in self.__bombs:
-            if bomb.update(clock, self.__map.get_grid().get_tilemap()):
+            if bomb.update(clock, tilemap):
                 bomb.draw(surface)
 
         # Updates fire animations
         for fire in self.__fires:
-            if fire.update(clock, self.__map.get_grid().get_tilemap()):
+            if fire.update(clock, tilemap):
                 fire.draw(surface)
 
         # Updates character animations
         for player in self.__players:
-            self.__update_character(player, clock, surface)
+            self.__update_character(player, clock, surface, tilemap)
         for cpu in self.__cpus:
-            self.__update_character(cpu, clock, surface)
+            self.__update_character(cpu, clock, surface, tilemap)
 
         self.__game_over.draw(surface)
         self.__game_state = self.__game_over.update()
 
-    def __update_character(self, character, clock, surface):
+    def __update_character(self, character, clock, surface, tilemap):
         """
         Updates and draws a character according to the map and its events.
         :param character: Character to be updated.
         :param clock: Match clock.
         :param surface: Drawing surface.
+        :param tilemap: Numpy array with the map information.
         :return: True if the character is still alive.
         """
 
-        tilemap = self.__map.get_grid().get_tilemap()
         if character.update(clock, tilemap):
             # Check if character died
             if (tilemap[character.tile] == Constants.UNIT_FIRE or
@@ -246,7 +284,7 @@ class Match:
                 if isinstance(character, Cpu) and character.is_alive:
                     character.reward(Constants.DEATH_REWARD)
                 character.special_event(CharacterEvents.DIE)
-                character.draw(surface)
+                self.__dirty_rects.append(character.draw(surface))
                 return False
             # Check if character picked up a powerup
             elif tilemap[character.tile] == Constants.UNIT_POWERUP_BOMB_SHOW:
@@ -264,7 +302,7 @@ class Match:
                 self.__bombs.append(Bomb(character.tile, character.fire_range,
                                          character.id, self.__sprites['bomb']))
 
-            character.draw(surface)
+            self.__dirty_rects.append(character.draw(surface))
             return True
 
         return False
@@ -34,6 +34,7 @@ class GameObject:
         """
         Abstract method which updates the game object icon on the screen.
         :param display: Pygame display object.
+        :return: Rect of the screen area the object was drawn on.
         """
 
         pass
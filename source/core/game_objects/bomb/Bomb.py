@@ -60,13 +60,15 @@ class Bomb(GameObject):
         animation. Note: This function should be called after update(), and
         only if update() returns True.
         :param display: Pygame display object.
+        :return: Rect of the screen area the icon was drawn on.
         """
 
         self.__icon = self.__animation.update()
-        display.blit(self.__icon,
-                     (self._pose.x - self.__icon.get_size()[0] / 2,
-                      self._pose.y + Constants.SQUARE_SIZE / 2 -
-                      self.__icon.get_size()[1] + Constants.DISPLAY_HEIGTH - 1))
+        return display.blit(self.__icon,
+                            (self._pose.x - self.__icon.get_size()[0] / 2,
+                             self._pose.y + Constants.SQUARE_SIZE / 2 -
+                             self.__icon.get_size()[1] +
+                             Constants.DISPLAY_HEIGTH - 1))
 
     def explode(self):
         """
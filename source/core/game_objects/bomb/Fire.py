@@ -174,44 +174,45 @@ class Fire(GameObject):
         animation. Note: This function should be called after update(), and
         only if update() returns True.
         :param display: Pygame display object.
+        :return: Rect of the screen area the fire was drawn on.
         """
 
         icon = self.__middle_animation.update()
-        display.blit(icon,
-                     (self._pose.x - icon.get_size()[0] / 2,
-                      self._pose.y + Constants.SQUARE_SIZE / 2 -
-                      icon.get_size()[1] + Constants.DISPLAY_HEIGTH))
+        rect = display.blit(icon,
+                            (self._pose.x - icon.get_size()[0] / 2,
+                             self._pose.y + Constants.SQUARE_SIZE / 2 -
+                             icon.get_size()[1] + Constants.DISPLAY_HEIGTH))
 
         for i in range(len(self.__up_branch)):
             icon = self.__up_branch[i].update()
-            display.blit(icon,
-                         (self._pose.x - icon.get_size()[0] / 2,
-                          self._pose.y - (2 * i + 1) *
-                          Constants.SQUARE_SIZE / 2 -
-                          icon.get_size()[1] + Constants.DISPLAY_HEIGTH))
+            rect.union_ip(display.blit(
+                icon, (self._pose.x - icon.get_size()[0] / 2,
+                       self._pose.y - (2 * i + 1) * Constants.SQUARE_SIZE / 2 -
+                       icon.get_size()[1] + Constants.DISPLAY_HEIGTH)))
 
         for i in range(len(self.__down_branch)):
             icon = self.__down_branch[i].update()
-            display.blit(icon,
-                         (self._pose.x - icon.get_size()[0] / 2,
-                          self._pose.y + (2 * i + 1) *
-                          Constants.SQUARE_SIZE / 2 + Constants.DISPLAY_HEIGTH))
+            rect.union_ip(display.blit(
+                icon, (self._pose.x - icon.get_size()[0] / 2,
+                       self._pose.y + (2 * i + 1) * Constants.SQUARE_SIZE / 2 +
+                       Constants.DISPLAY_HEIGTH)))
 
         for i in range(len(self.__left_branch)):
             icon = self.__left_branch[i].update()
-            display.blit(icon,
-                         (self._pose.x - (2 * i + 1) *
-                          Constants.SQUARE_SIZE / 2 - icon.get_size()[0],
-                          self._pose.y - icon.get_size()[1] / 2 +
-                          Constants.DISPLAY_HEIGTH))
+            rect.union_ip(display.blit(
+                icon, (self._pose.x - (2 * i + 1) * Constants.SQUARE_SIZE / 2 -
+                       icon.get_size()[0],
+                       self._pose.y - icon.get_size()[1] / 2 +
+                       Constants.DISPLAY_HEIGTH)))
 
         for i in range(len(self.__right_branch)):
             icon = self.__right_branch[i].update()
-            display.blit(icon,
-                         (self._pose.x + (2 * i + 1) *
-                          Constants.SQUARE_SIZE / 2,
-                          self._pose.y - icon.get_size()[1] / 2 +
-                          Constants.DISPLAY_HEIGTH))
+            rect.union_ip(display.blit(
+                icon, (self._pose.x + (2 * i + 1) * Constants.SQUARE_SIZE / 2,
+                       self._pose.y - icon.get_size()[1] / 2 +
+                       Constants.DISPLAY_HEIGTH)))
+
+        return rect
 
     def get_triggered_bombs(self):
         """
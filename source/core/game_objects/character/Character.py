@@ -8,6 +8,92 @@ from source.core.ui.Sprite import Sprite
 from source.core.utils import Constants
 from source.core.utils.ObjectEvents import CharacterEvents
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        Fallback for numba's njit when it is not installed: the decorated
+        function runs as plain python.
+        """
+
+        def decorator(function):
+            return function
+
+        return decorator
+
+# Module level constants, which numba compiles as literals
+_MOVE_UP = CharacterEvents.MOVE_UP.value
+_MOVE_DOWN = CharacterEvents.MOVE_DOWN.value
+_MOVE_RIGHT = CharacterEvents.MOVE_RIGHT.value
+_MOVE_LEFT = CharacterEvents.MOVE_LEFT.value
+_STOP_UP = CharacterEvents.STOP_UP.value
+_STOP_DOWN = CharacterEvents.STOP_DOWN.value
+_STOP_RIGHT = CharacterEvents.STOP_RIGHT.value
+_STOP_LEFT = CharacterEvents.STOP_LEFT.value
+_UNIT_BOMB = Constants.UNIT_BOMB
+_OBSTACLE_LUT = Constants.OBSTACLE_LUT
+
+# Steering tables, indexed by the movement event value. The probe is the
+# half square sign and pixel shift applied to the coordinate along the
+# movement, ahead is the tile offset in that direction, and the turn events
+# move towards the lower and higher lateral coordinate.
+# Probes: (1, -2) is "coordinate + sq / 2 - 2", used upwards and leftwards,
+# and (-1, 0) is "coordinate - sq / 2", used downwards and rightwards.
+_STEER_PROBE = np.zeros((4, 2), dtype=np.int64)
+_STEER_PROBE[[_MOVE_UP, _MOVE_DOWN, _MOVE_RIGHT, _MOVE_LEFT]] = [
+    (1, -2), (-1, 0), (-1, 0), (1, -2)]
+_STEER_AHEAD = np.zeros(4, dtype=np.int64)
+_STEER_AHEAD[[_MOVE_UP, _MOVE_DOWN, _MOVE_RIGHT, _MOVE_LEFT]] = [-1, 1, 1, -1]
+_STEER_STRICT_MINUS = np.zeros(4, dtype=np.bool_)
+_STEER_STRICT_MINUS[_MOVE_UP] = True
+_STEER_TURN_EVENT = np.zeros((4, 2), dtype=np.int64)
+_STEER_TURN_EVENT[[_MOVE_UP, _MOVE_DOWN, _MOVE_RIGHT, _MOVE_LEFT]] = [
+    (_MOVE_LEFT, _MOVE_RIGHT), (_MOVE_LEFT, _MOVE_RIGHT),
+    (_MOVE_UP, _MOVE_DOWN), (_MOVE_UP, _MOVE_DOWN)]
+_STEER_STOP_EVENT = np.zeros(4, dtype=np.int64)
+_STEER_STOP_EVENT[[_MOVE_UP, _MOVE_DOWN, _MOVE_RIGHT, _MOVE_LEFT]] = [
+    _STOP_UP, _STOP_DOWN, _STOP_RIGHT, _STOP_LEFT]
+
+# Steering outcomes, indexed by a 5 bit state built in _steer as
+#   ahead_free << 4 | bucket << 2 | minus << 1 | plus
+# where ahead_free tells if the tile ahead is free, bucket is the lateral
+# position (0: centered, 1: low, 2: high; 3 is unreachable), and minus and
+# plus tell if the character can slide towards the lower or the higher
+# lateral neighbour.
+_STEER_CENTER = 0
+_STEER_PLUS = 1
+_STEER_MINUS = 2
+_STEER_STOP = 3
+_STEER_OUTCOMES = np.empty(32, dtype=np.int64)
+for _ahead_free in range(2):
+    for _bucket in range(4):
+        for _minus in range(2):
+            for _plus in range(2):
+                if _ahead_free:
+                    # Free way: center on the tile or turn towards its middle
+                    _outcome = (_STEER_CENTER, _STEER_PLUS, _STEER_MINUS,
+                                _STEER_STOP)[_bucket]
+                elif _minus:
+                    _outcome = _STEER_MINUS
+                elif _plus:
+                    _outcome = _STEER_PLUS
+                else:
+                    _outcome = _STEER_STOP
+                _STEER_OUTCOMES[_ahead_free << 4 | _bucket << 2 |
+                                _minus << 1 | _plus] = _outcome
+del _ahead_free, _bucket, _minus, _plus, _outcome
+
+# Direction of each movement event and the event a stopped movement turns into
+_DIRECTIONS = {CharacterEvents.MOVE_UP: (0, -1),
+               CharacterEvents.MOVE_DOWN: (0, 1),
+               CharacterEvents.MOVE_RIGHT: (1, 0),
+               CharacterEvents.MOVE_LEFT: (-1, 0)}
+_STOP_EVENTS = {CharacterEvents.MOVE_UP: CharacterEvents.STOP_UP,
+                CharacterEvents.MOVE_DOWN: CharacterEvents.STOP_DOWN,
+                CharacterEvents.MOVE_RIGHT: CharacterEvents.STOP_RIGHT,
+                CharacterEvents.MOVE_LEFT: CharacterEvents.STOP_LEFT}
+
 
 class Character(GameObject):
     """
@@ -37,6 +123,7 @@ class Character(GameObject):
         self._got_special_event = False
         self._just_placed_bomb = False
         self.__is_alive = True
+        self.__dying = False
 
         self.__setup_animations()
         self.__assets_path = (os.path.dirname(os.path.realpath(__file__)) +
@@ -52,7 +139,7 @@ class Character(GameObject):
 
         # If the dying animation ended, returns False: this character must not
         # be drawed.
-        if self.__die_animation.done():
+        if self.__dying and self.__die_animation.done():
             return False
 
         # Handles event variables
@@ -62,25 +149,13 @@ class Character(GameObject):
             self._got_special_event = False
 
         # Finite state machine
-        if self._new_event == CharacterEvents.MOVE_UP:
-            self.__move((0, -1), clock, tilemap)
-        elif self._new_event == CharacterEvents.MOVE_DOWN:
-            self.__move((0, 1), clock, tilemap)
-        elif self._new_event == CharacterEvents.MOVE_RIGHT:
-            self.__move((1, 0), clock, tilemap)
-        elif self._new_event == CharacterEvents.MOVE_LEFT:
-            self.__move((-1, 0), clock, tilemap)
+        direction = _DIRECTIONS.get(self._new_event)
+        if direction:
+            self.__move(direction, clock, tilemap)
         elif self._new_event == CharacterEvents.PLACE_BOMB:
             self._just_placed_bomb = True
         elif self._new_event == CharacterEvents.NOTHING:
-            if previous_event == CharacterEvents.MOVE_LEFT:
-                self._event = CharacterEvents.STOP_LEFT
-            elif previous_event == CharacterEvents.MOVE_UP:
-                self._event = CharacterEvents.STOP_UP
-            elif previous_event == CharacterEvents.MOVE_RIGHT:
-                self._event = CharacterEvents.STOP_RIGHT
-            elif previous_event == CharacterEvents.MOVE_DOWN:
-                self._event = CharacterEvents.STOP_DOWN
+            self._event = _STOP_EVENTS.get(previous_event, self._event)
 
         return True
 
@@ -90,35 +165,19 @@ class Character(GameObject):
         animations. Note: This function should be called after update(), and
         only if update() returns True.
         :param display: Pygame display object.
+        :return: Rect of the screen area the icon was drawn on.
         """
 
         # Finite state machine
-        if self._event == CharacterEvents.MOVE_UP:
-            self.__icon = self.__move_up_animation.update()
-        elif self._event == CharacterEvents.STOP_UP:
-            self.__icon = self.__sprite['up']
-        elif self._event == CharacterEvents.MOVE_DOWN:
-            self.__icon = self.__move_down_animation.update()
-        elif self._event == CharacterEvents.STOP_DOWN:
-            self.__icon = self.__sprite['down']
-        elif self._event == CharacterEvents.MOVE_LEFT:
-            self.__icon = self.__move_left_animation.update()
-        elif self._event == CharacterEvents.STOP_LEFT:
-            self.__icon = self.__sprite['left']
-        elif self._event == CharacterEvents.MOVE_RIGHT:
-            self.__icon = self.__move_right_animation.update()
-        elif self._event == CharacterEvents.STOP_RIGHT:
-            self.__icon = self.__sprite['right']
-        elif self._event == CharacterEvents.WIN:
-            self.__icon = self.__win_animation.update()
-        elif self._event == CharacterEvents.DIE:
-            self.__icon = self.__die_animation.update()
+        animation = self.__animations.get(self._event)
+        if animation:
+            self.__icon = animation.update()
+        else:
+            self.__icon = self.__stop_icons.get(self._event, self.__icon)
 
         # Positioning the blit according to the icon size
-        display.blit(self.__icon, (self._pose.x - self.__icon.get_size()[0] / 2,
-                                   self._pose.y + Constants.SQUARE_SIZE / 2 -
-                                   self.__icon.get_size()[1] +
-                                   Constants.DISPLAY_HEIGTH))
+        dx, dy = self.__blit_offsets[id(self.__icon)]
+        return display.blit(self.__icon, (self._pose.x + dx, self._pose.y + dy))
 
     def placed_bomb(self, map_unit):
         """
@@ -154,6 +213,7 @@ class Character(GameObject):
         self._got_special_event = True
 
         if event == CharacterEvents.DIE:
+            self.__dying = True
             if self.__is_alive:
                 music_path = self.__assets_path + "song/die.wav"
                 music = pygame.mixer.Sound(music_path)
@@ -176,14 +236,11 @@ class Character(GameObject):
 
         step_frequency = Constants.STEPS_PER_SQUARE * (
                 Constants.INITIAL_SPEED + self.__speed / Constants.MAX_SPEED)
-        self.__move_up_animation.set_durations(
-            np.ones(2) / step_frequency)
-        self.__move_down_animation.set_durations(
-            np.ones(2) / step_frequency)
-        self.__move_right_animation.set_durations(
-            np.ones(2) / step_frequency)
-        self.__move_left_animation.set_durations(
-            np.ones(2) / step_frequency)
+        step_durations = (1 / step_frequency, 1 / step_frequency)
+        self.__move_up_animation.set_durations(step_durations)
+        self.__move_down_animation.set_durations(step_durations)
+        self.__move_right_animation.set_durations(step_durations)
+        self.__move_left_animation.set_durations(step_durations)
 
         music_path = self.__assets_path + "song/powerup_shoe.wav"
         music = pygame.mixer.Sound(music_path)
@@ -259,35 +316,56 @@ class Character(GameObject):
 
         # Movements
         step_frequency = self.__speed * Constants.STEPS_PER_SQUARE
+        step_durations = (1 / step_frequency, 1 / step_frequency)
         self.__move_up_animation = Animation(
             [self.__sprite['move_up1'], self.__sprite['move_up2']],
-            np.ones(2) / step_frequency)
+            step_durations)
         self.__move_down_animation = Animation(
             [self.__sprite['move_down1'], self.__sprite['move_down2']],
-            1 / (self.__speed * Constants.STEPS_PER_SQUARE * np.ones(2)))
+            step_durations)
         self.__move_right_animation = Animation(
             [self.__sprite['move_right1'], self.__sprite['move_right2']],
-            1 / (self.__speed * Constants.STEPS_PER_SQUARE * np.ones(2)))
+            step_durations)
         self.__move_left_animation = Animation(
             [self.__sprite['move_left1'], self.__sprite['move_left2']],
-            1 / (self.__speed * Constants.STEPS_PER_SQUARE * np.ones(2)))
+            step_durations)
 
         # Winning
         self.__win_animation = Animation([
             self.__sprite['win1'], self.__sprite['win2'],
-            self.__sprite['win3']], np.array([0.25, 0.25, 0.5]))
+            self.__sprite['win3']], [0.25, 0.25, 0.5])
 
         # Dying: The character spins 5 times than falls on the ground.
-        die_sprites = np.concatenate([np.tile(
-            [self.__sprite['die_down'], self.__sprite['die_right'],
-             self.__sprite['die_up'], self.__sprite['die_left']], 5),
-            [self.__sprite['die_down'],
-             self.__sprite['die1'], self.__sprite['die1'],
-             self.__sprite['die3'], self.__sprite['die4'],
-             self.__sprite['die5'], self.__sprite['die6']]])
-        die_durations = np.concatenate([np.tile(0.1, 20), 0.5 * np.ones(7)])
+        die_sprites = [self.__sprite['die_down'], self.__sprite['die_right'],
+                       self.__sprite['die_up'], self.__sprite['die_left']] * 5
+        die_sprites += [self.__sprite['die_down'],
+                        self.__sprite['die1'], self.__sprite['die1'],
+                        self.__sprite['die3'], self.__sprite['die4'],
+                        self.__sprite['die5'], self.__sprite['die6']]
+        die_durations = [0.1] * 20 + [0.5] * 7
         self.__die_animation = Animation(die_sprites, die_durations, stop=True)
 
+        # Blit offsets of each icon, which depend only on its size
+        self.__blit_offsets = {
+            id(icon): (-icon.get_size()[0] / 2,
+                       Constants.SQUARE_SIZE / 2 - icon.get_size()[1] +
+                       Constants.DISPLAY_HEIGTH)
+            for icon in self.__sprite.values()}
+
+        # Icons and animations drawn for each event
+        self.__stop_icons = {
+            CharacterEvents.STOP_UP: self.__sprite['up'],
+            CharacterEvents.STOP_DOWN: self.__sprite['down'],
+            CharacterEvents.STOP_LEFT: self.__sprite['left'],
+            CharacterEvents.STOP_RIGHT: self.__sprite['right']}
+        self.__animations = {
+            CharacterEvents.MOVE_UP: self.__move_up_animation,
+            CharacterEvents.MOVE_DOWN: self.__move_down_animation,
+            CharacterEvents.MOVE_LEFT: self.__move_left_animation,
+            CharacterEvents.MOVE_RIGHT: self.__move_right_animation,
+            CharacterEvents.WIN: self.__win_animation,
+            CharacterEvents.DIE: self.__die_animation}
+
     def __move(self, direction, clock, tilemap):
         """
         Moves the character according to obstacles.
@@ -295,147 +373,119 @@ class Character(GameObject):
         :param tilemap: Numpy array with the map information.
         """
 
-        # Auxiliar variables
-        sq = Constants.SQUARE_SIZE
-        obstacles = np.array([Constants.UNIT_BLOCK, Constants.UNIT_FIXED_BLOCK,
-                              Constants.UNIT_POWERUP_FIRE_HIDE,
-                              Constants.UNIT_POWERUP_VELOCITY_HIDE,
-                              Constants.UNIT_POWERUP_BOMB_HIDE,
-                              Constants.UNIT_DESTROYING_BLOCK])
-        bomb = Constants.UNIT_BOMB
-
-        x = self._pose.x
-        x_tile = int(x / sq)
-
-        # Choosing most natural movement upwards according to blocked blocks
-        y = self._pose.y + sq / 2 - 2
-        y_tile = int(y / sq)
-        if self._event == CharacterEvents.MOVE_UP:
-            if not np.any(obstacles == tilemap[y_tile - 1, x_tile]) and (
-                    tilemap[y_tile - 1, x_tile] != bomb or
-                    tilemap[self.tile] == bomb):
-                if sq * 0.35 < x % sq < sq * 0.65:
-                    self._pose.x = (x_tile + 0.5) * sq
-                elif x % sq <= sq * 0.35:
-                    direction = (1, 0)
-                    self._event = CharacterEvents.MOVE_RIGHT
-                else:
-                    direction = (-1, 0)
-                    self._event = CharacterEvents.MOVE_LEFT
-            elif (not np.any(obstacles == tilemap[y_tile - 1, x_tile - 1]) and
-                  0 < x % sq < sq / 4 and (tilemap[y_tile - 1, x_tile - 1] !=
-                                           bomb or tilemap[self.tile] == bomb)):
-                direction = (-1, 0)
-                self._event = CharacterEvents.MOVE_LEFT
-            elif (not np.any(obstacles == tilemap[y_tile - 1, x_tile + 1]) and
-                  3 * sq / 4 < x % sq < sq and (
-                          tilemap[y_tile - 1, x_tile + 1] != bomb or
-                          tilemap[self.tile] == bomb)):
-                direction = (1, 0)
-                self._event = CharacterEvents.MOVE_RIGHT
-            else:
-                direction = (0, 0)
-                self._event = CharacterEvents.STOP_UP
-
-        # Choosing most natural movement downwards according to blocked blocks
-        y = self._pose.y - sq / 2
-        y_tile = int(y / sq)
-        if self._event == CharacterEvents.MOVE_DOWN:
-            if not np.any(obstacles == tilemap[y_tile + 1, x_tile]) and (
-                    tilemap[y_tile + 1, x_tile] != bomb or
-                    tilemap[self.tile] == bomb):
-                if sq * 0.35 < x % sq < sq * 0.65:
-                    self._pose.x = (x_tile + 0.5) * sq
-                elif x % sq <= sq * 0.35:
-                    direction = (1, 0)
-                    self._event = CharacterEvents.MOVE_RIGHT
-                else:
-                    direction = (-1, 0)
-                    self._event = CharacterEvents.MOVE_LEFT
-            elif (not np.any(obstacles == tilemap[y_tile + 1, x_tile - 1]) and
-                  0 <= x % sq < sq / 4 and (
-                          tilemap[y_tile + 1, x_tile - 1] != bomb or
-                          tilemap[self.tile] == bomb)):
-                direction = (-1, 0)
-                self._event = CharacterEvents.MOVE_LEFT
-            elif (not np.any(obstacles == tilemap[y_tile + 1, x_tile + 1]) and
-                  3 * sq / 4 < x % sq < sq and (
-                          tilemap[y_tile + 1, x_tile + 1] != bomb or
-                          tilemap[self.tile] == bomb)):
-                direction = (1, 0)
-                self._event = CharacterEvents.MOVE_RIGHT
-            else:
-                direction = (0, 0)
-                self._event = CharacterEvents.STOP_DOWN
-
-        y = self._pose.y
-        y_tile = int(y / sq)
-
-        # Choosing most natural movement rightwards according to blocked blocks
-        x = self._pose.x - sq / 2
-        x_tile = int(x / sq)
-        if self._event == CharacterEvents.MOVE_RIGHT:
-            if not np.any(obstacles == tilemap[y_tile, x_tile + 1]) and (
-                    tilemap[y_tile, x_tile + 1] != bomb or
-                    tilemap[self.tile] == bomb):
-                if sq * 0.35 < y % sq < sq * 0.65:
-                    self._pose.y = (y_tile + 0.5) * sq
-                elif y % sq <= sq * 0.35:
-                    direction = (0, 1)
-                    self._event = CharacterEvents.MOVE_DOWN
-                else:
-                    direction = (0, -1)
-                    self._event = CharacterEvents.MOVE_UP
-            elif (not np.any(obstacles == tilemap[y_tile - 1, x_tile + 1]) and
-                  0 <= y % sq < sq / 4 and (
-                          tilemap[y_tile - 1, x_tile + 1] != bomb or
-                          tilemap[self.tile] == bomb)):
-                direction = (0, -1)
-                self._event = CharacterEvents.MOVE_UP
-            elif (not np.any(obstacles == tilemap[y_tile + 1, x_tile + 1]) and
-                  3 * sq / 4 < y % sq < sq and (
-                          tilemap[y_tile + 1, x_tile + 1] != bomb or
-                          tilemap[self.tile] == bomb)):
-                direction = (0, 1)
-                self._event = CharacterEvents.MOVE_DOWN
+        # Choosing most natural movement according to blocked blocks
+        dx, dy, event, self._pose.x, self._pose.y = _steer(
+            self._event.value, direction[0], direction[1],
+            float(self._pose.x), float(self._pose.y),
+            bool(tilemap[self.tile] == Constants.UNIT_BOMB), tilemap,
+            Constants.SQUARE_SIZE)
+        self._event = CharacterEvents(event)
+
+        # Walking towards best direction
+        fps = clock.get_fps()
+        if fps != 0:
+            step = self.__speed * Constants.SQUARE_SIZE / fps
+            self._pose.x += dx * step
+            self._pose.y += dy * step
+
+
+def compile_steering(tilemap):
+    """
+    Runs the steering function once, so numba compiles it while the match is
+    loading instead of on the first movement of a character.
+    :param tilemap: Numpy array with the map information.
+    """
+
+    sq = Constants.SQUARE_SIZE
+    _steer(_MOVE_UP, 0, -1, 1.5 * sq, 1.5 * sq, False, tilemap, sq)
+
+
+@njit(cache=True)
+def _is_free(unit, on_bomb):
+    """
+    Checks if a character can walk into a map unit.
+    :param unit: Map unit.
+    :param on_bomb: True if the character is standing on a bomb.
+    :return: True if the unit is not an obstacle.
+    """
+
+    return not _OBSTACLE_LUT[unit] and (unit != _UNIT_BOMB or on_bomb)
+
+
+@njit(cache=True)
+def _steer(event, dx, dy, x, y, on_bomb, tilemap, sq):
+    """
+    Chooses the most natural movement for a character according to blocked
+    blocks. It only works with numbers and the tilemap, so it can be compiled.
+    Each movement is resolved by looking up its outcome in _STEER_OUTCOMES.
+    Upwards and downwards movements may turn sideways, which are then resolved
+    in the same call, as sideways movements are checked after them.
+    :param event: Value of the CharacterEvents event the character is in.
+    :param dx: Desired x direction.
+    :param dy: Desired y direction.
+    :param x: Character's x coordinate in pixels.
+    :param y: Character's y coordinate in pixels.
+    :param on_bomb: True if the character is standing on a bomb.
+    :param tilemap: Numpy array with the map information.
+    :param sq: Square size in pixels.
+    :return: Tuple with the x and y directions, the new event value and the
+    adjusted x and y coordinates.
+    """
+
+    for move in (_MOVE_UP, _MOVE_DOWN, _MOVE_RIGHT, _MOVE_LEFT):
+        if event != move:
+            continue
+
+        # Coordinate across the movement and probe along it, in pixels
+        vertical = move == _MOVE_UP or move == _MOVE_DOWN
+        if vertical:
+            lateral = x
+            forward = y
+        else:
+            lateral = y
+            forward = x
+        lateral_tile = int(lateral / sq)
+        forward_tile = int((forward + _STEER_PROBE[move, 0] * sq / 2 +
+                            _STEER_PROBE[move, 1]) / sq) + _STEER_AHEAD[move]
+
+        # Units ahead of the character and ahead of each lateral neighbour
+        if vertical:
+            ahead = tilemap[forward_tile, lateral_tile]
+            ahead_minus = tilemap[forward_tile, lateral_tile - 1]
+            ahead_plus = tilemap[forward_tile, lateral_tile + 1]
+        else:
+            ahead = tilemap[lateral_tile, forward_tile]
+            ahead_minus = tilemap[lateral_tile - 1, forward_tile]
+            ahead_plus = tilemap[lateral_tile + 1, forward_tile]
+
+        # Packing the blocked units and lateral position into a table index
+        fraction = lateral % sq
+        if sq * 0.35 < fraction < sq * 0.65:
+            bucket = 0
+        elif fraction <= sq * 0.35:
+            bucket = 1
+        else:
+            bucket = 2
+        minus = (_is_free(ahead_minus, on_bomb) and fraction < sq / 4 and
+                 (0 < fraction or not _STEER_STRICT_MINUS[move]))
+        plus = _is_free(ahead_plus, on_bomb) and 3 * sq / 4 < fraction < sq
+        ahead_free = _is_free(ahead, on_bomb)
+        outcome = _STEER_OUTCOMES[int(ahead_free) << 4 | bucket << 2 |
+                                  int(minus) << 1 | int(plus)]
+
+        if outcome == _STEER_CENTER:
+            if vertical:
+                x = (lateral_tile + 0.5) * sq
             else:
-                direction = (0, 0)
-                self._event = CharacterEvents.STOP_RIGHT
-
-        # Choosing most natural movement leftwards according to blocked blocks
-        x = self._pose.x + sq / 2 - 2
-        x_tile = int(x / sq)
-        if self._event == CharacterEvents.MOVE_LEFT:
-            if not np.any(obstacles == tilemap[y_tile, x_tile - 1]) and (
-                    tilemap[y_tile, x_tile - 1] != bomb or
-                    tilemap[self.tile] == bomb):
-                if sq * 0.35 < y % sq < sq * 0.65:
-                    self._pose.y = (y_tile + 0.5) * sq
-                elif y % sq <= sq * 0.35:
-                    direction = (0, 1)
-                    self._event = CharacterEvents.MOVE_DOWN
-                else:
-                    direction = (0, -1)
-                    self._event = CharacterEvents.MOVE_UP
-            elif (not np.any(obstacles == tilemap[y_tile - 1, x_tile - 1]) and
-                  0 <= y % sq < sq / 4 and (
-                          tilemap[y_tile - 1, x_tile - 1] != bomb or
-                          tilemap[self.tile] == bomb)):
-                direction = (0, -1)
-                self._event = CharacterEvents.MOVE_UP
-            elif (not np.any(obstacles == tilemap[y_tile + 1, x_tile - 1]) and
-                  3 * sq / 4 < y % sq < sq and (
-                          tilemap[y_tile + 1, x_tile - 1] != bomb or
-                          tilemap[self.tile] == bomb)):
-                direction = (0, 1)
-                self._event = CharacterEvents.MOVE_DOWN
+                y = (lateral_tile + 0.5) * sq
+        elif outcome == _STEER_STOP:
+            dx, dy, event = 0, 0, _STEER_STOP_EVENT[move]
+        else:
+            side = 1 if outcome == _STEER_PLUS else -1
+            event = _STEER_TURN_EVENT[move, (side + 1) // 2]
+            if vertical:
+                dx, dy = side, 0
             else:
-                direction = (0, 0)
-                self._event = CharacterEvents.STOP_LEFT
+                dx, dy = 0, side
 
-        # Walking towards best direction
-        if clock.get_fps() != 0:
-            self._pose.x += (direction[0] * self.__speed *
-                             Constants.SQUARE_SIZE / clock.get_fps())
-            self._pose.y += (direction[1] * self.__speed *
-                             Constants.SQUARE_SIZE / clock.get_fps())
+    return dx, dy, event, x, y
@@ -1,5 +1,3 @@
-import numpy as np
-
 from source.core.game_objects.character.Character import Character
 from source.core.utils.ObjectEvents import CharacterEvents
 
@@ -22,7 +20,8 @@ class Player(Character):
 
         super().__init__(initial_tile, sprite_name, id)
 
-        self.__velocity = np.array([0, 0])
+        self.__vx = 0
+        self.__vy = 0
         self.__key_commands = key_commands
 
     def key_up(self, key):
@@ -34,26 +33,26 @@ class Player(Character):
         if not (self._new_event == CharacterEvents.WIN or
                 self._new_event == CharacterEvents.DIE):
             if key == self.__key_commands['left']:
-                self.__velocity += (1, 0)
+                self.__vx += 1
                 self._new_event = CharacterEvents.STOP_LEFT
             elif key == self.__key_commands['right']:
-                self.__velocity += (-1, 0)
+                self.__vx -= 1
                 self._new_event = CharacterEvents.STOP_RIGHT
             elif key == self.__key_commands['up']:
-                self.__velocity += (0, 1)
+                self.__vy += 1
                 self._new_event = CharacterEvents.STOP_UP
             elif key == self.__key_commands['down']:
-                self.__velocity += (0, -1)
+                self.__vy -= 1
                 self._new_event = CharacterEvents.STOP_DOWN
 
             if not self._got_special_event:
-                if self.__velocity[1] == 1:
+                if self.__vy == 1:
                     self._new_event = CharacterEvents.MOVE_DOWN
-                elif self.__velocity[1] == -1:
+                elif self.__vy == -1:
                     self._new_event = CharacterEvents.MOVE_UP
-                elif self.__velocity[0] == 1:
+                elif self.__vx == 1:
                     self._new_event = CharacterEvents.MOVE_RIGHT
-                elif self.__velocity[0] == -1:
+                elif self.__vx == -1:
                     self._new_event = CharacterEvents.MOVE_LEFT
 
     def key_down(self, key):
@@ -65,24 +64,24 @@ class Player(Character):
         if not (self._new_event == CharacterEvents.WIN or
                 self._new_event == CharacterEvents.DIE):
             if key == self.__key_commands['left']:
-                self.__velocity += (-1, 0)
+                self.__vx -= 1
             elif key == self.__key_commands['right']:
-                self.__velocity += (1, 0)
+                self.__vx += 1
             elif key == self.__key_commands['up']:
-                self.__velocity += (0, -1)
+                self.__vy -= 1
             elif key == self.__key_commands['down']:
-                self.__velocity += (0, 1)
+                self.__vy += 1
             elif key == self.__key_commands['bomb']:
                 # Not assigning to an event or the player will stop when placing
                 # a bomb.
                 self._just_placed_bomb = True
 
             if not self._got_special_event:
-                if self.__velocity[1] == 1:
+                if self.__vy == 1:
                     self._new_event = CharacterEvents.MOVE_DOWN
-                elif self.__velocity[1] == -1:
+                elif self.__vy == -1:
                     self._new_event = CharacterEvents.MOVE_UP
-                elif self.__velocity[0] == 1:
+                elif self.__vx == 1:
                     self._new_event = CharacterEvents.MOVE_RIGHT
-                elif self.__velocity[0] == -1:
+                elif self.__vx == -1:
                     self._new_event = CharacterEvents.MOVE_LEFT
@@ -18,7 +18,7 @@ class Animation:
         happen in the game.
         :param keyframe_list: List of pygame.image's with each keyframe of the
         animation in order.
-        :param durations: List of time duration for each icon in seconds.
+        :param durations: Sequence of time durations for each icon in seconds.
         :param stop: Bool which chooses a looping animation or one that has an
         end. If it is true, the animation will stop after iterating through all
         icons, activating the done() method.
@@ -55,7 +55,7 @@ class Animation:
     def set_durations(self, durations):
         """
         Sets new durations for each icon.
-        :param durations: List of new durations in seconds.
+        :param durations: Sequence of new durations in seconds.
         """
 
         self.__durations = durations
@@ -1,3 +1,4 @@
+import numpy as np
 import os
 import time
 import pygame
@@ -13,11 +14,11 @@ class Map:
     def __init__(self, initial_time):
         assets_dir = (os.path.dirname(os.path.realpath(__file__)) +
                       '/../../../assets/')
-        self.__brick = pygame.image.load(assets_dir + "image/brick.png")
-        self.__block = pygame.image.load(assets_dir + "image/block.png")
-        self.__fire = pygame.image.load(assets_dir + "image/fire.png")
-        self.__bomb = pygame.image.load(assets_dir + "image/bomb.png")
-        self.__shoes = pygame.image.load(assets_dir + "image/shoes.png")
+        self.__brick = pygame.image.load(assets_dir + "image/brick.png").convert_alpha()
+        self.__block = pygame.image.load(assets_dir + "image/block.png").convert_alpha()
+        self.__fire = pygame.image.load(assets_dir + "image/fire.png").convert_alpha()
+        self.__bomb = pygame.image.load(assets_dir + "image/bomb.png").convert_alpha()
+        self.__shoes = pygame.image.load(assets_dir + "image/shoes.png").convert_alpha()
 
         self.__grid = Grid()
         self.__dim = self.__grid.get_dimension()
@@ -34,11 +35,32 @@ class Map:
                                                              SQUARE_SIZE))
 
         # Score elements
-        self.__player_face = pygame.image.load(assets_dir + "image/bomber_face.png")
+        self.__player_face = pygame.image.load(assets_dir + "image/bomber_face.png").convert()
         self.__player_face = pygame.transform.scale(self.__player_face, (3 * SCORE_SIZE,
                                                                          3 * SCORE_SIZE))
         self.__font = pygame.font.Font(assets_dir + "font/04B_30__.TTF", 2 * FONT_SIZE)
         self.__time = (0, 0)
+        self.__drawn_time = None
+
+        # Images drawn for each group of map units
+        self.__tile_images = (
+            (self.__block, [UNIT_FIXED_BLOCK]),
+            (self.__brick, [UNIT_BLOCK, UNIT_POWERUP_FIRE_HIDE,
+                            UNIT_POWERUP_VELOCITY_HIDE, UNIT_POWERUP_BOMB_HIDE]),
+            (self.__fire, [UNIT_POWERUP_FIRE_SHOW]),
+            (self.__shoes, [UNIT_POWERUP_VELOCITY_SHOW]),
+            (self.__bomb, [UNIT_POWERUP_BOMB_SHOW]))
+
+        # Unit drawn on the background for each map unit. Units without an
+        # image, such as bombs and fires, map to UNIT_EMPTY.
+        self.__background_units = np.full(NUM_UNITS, UNIT_EMPTY)
+        for image, units in self.__tile_images:
+            self.__background_units[units] = units
+
+        # Cached static layer with the tiles, rebuilt only when the units it
+        # draws change
+        self.__background = None
+        self.__background_layer = None
 
         # Pause elements
         self.__t0 = initial_time
@@ -46,35 +68,53 @@ class Map:
         self.__delta_pause = 0
 
     def draw(self, surface):
+        """
+        Draws the map tiles and the score.
+        :param surface: Pygame surface.
+        :return: List of rects which changed since the previous draw.
+        """
+
+        dirty_rects = list()
         surface.fill(GREEN)
 
-        pos = (0, DISPLAY_HEIGTH)
-
-        for x in range(self.__dim[0]):
-            for y in range(self.__dim[1]):
-                if self.__grid.__getattr__(position=(x, y)) == UNIT_FIXED_BLOCK:
-                    surface.blit(self.__block, pos)
-                elif self.__grid.__getattr__(position=(x, y)) == UNIT_BLOCK:
-                    surface.blit(self.__brick, pos)
-                elif self.__grid.__getattr__(position=(x, y)) == UNIT_POWERUP_FIRE_HIDE:
-                    surface.blit(self.__brick, pos)
-                elif self.__grid.__getattr__(position=(x, y)) == UNIT_POWERUP_VELOCITY_HIDE:
-                    surface.blit(self.__brick, pos)
-                elif self.__grid.__getattr__(position=(x, y)) == UNIT_POWERUP_BOMB_HIDE:
-                    surface.blit(self.__brick, pos)
-                elif self.__grid.__getattr__(position=(x, y)) == UNIT_POWERUP_FIRE_SHOW:
-                    surface.blit(self.__fire, pos)
-                elif self.__grid.__getattr__(position=(x, y)) == UNIT_POWERUP_VELOCITY_SHOW:
-                    surface.blit(self.__shoes, pos)
-                elif self.__grid.__getattr__(position=(x, y)) == UNIT_POWERUP_BOMB_SHOW:
-                    surface.blit(self.__bomb, pos)
-
-                pos = (pos[0] + SQUARE_SIZE, pos[1])
-
-            pos = (0, pos[1] + SQUARE_SIZE)
+        layer = self.__background_units[self.__grid.get_tilemap()]
+        if (self.__background is None or
+                not np.array_equal(self.__background_layer, layer)):
+            self.__render_background(layer)
+            dirty_rects.append(pygame.Rect(0, DISPLAY_HEIGTH, MAP_WIDTH,
+                                           MAP_HEIGTH))
+        surface.blit(self.__background, (0, DISPLAY_HEIGTH))
 
         # Draw Score
         self.draw_score(surface)
+        if self.__time != self.__drawn_time:
+            dirty_rects.append(pygame.Rect(0, 0, WINDOW_WIDTH, DISPLAY_HEIGTH))
+            self.__drawn_time = self.__time
+
+        return dirty_rects
+
+    def __render_background(self, layer):
+        """
+        Renders the map tiles once into the cached background surface and
+        stores the layer it was built from.
+        :param layer: Tilemap with only the units drawn on the background.
+        """
+
+        self.__background = pygame.Surface((MAP_WIDTH, MAP_HEIGTH)).convert()
+        self.__background.fill(GREEN)
+
+        blit_sequence = list()
+
+        for image, units in self.__tile_images:
+            positions = np.argwhere(np.isin(layer, units)) * SQUARE_SIZE
+            for row, column in positions.tolist():
+                blit_sequence.append((image, (column, row)))
+
+        # fblits is only available on pygame-ce, blits is the fallback
+        blit = getattr(self.__background, 'fblits', self.__background.blits)
+        blit(blit_sequence)
+
+        self.__background_layer = layer
 
     def update(self):
         pass
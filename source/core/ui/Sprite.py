@@ -68,8 +68,10 @@ class Sprite:
             height = round(self.__icons[key].get_size()[1] *
                            width / self.__icons[key].get_size()[0] +
                            self.__delta[1])
+            # Converting to the display format, keeping the colorkey, so the
+            # icons are not converted again on every blit
             self.__icons[key] = pygame.transform.scale(self.__icons[key],
-                                                       (width, height))
+                                                       (width, height)).convert()
 
     def get_dict(self):
         """
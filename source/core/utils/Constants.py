@@ -1,3 +1,5 @@
+import numpy as np
+
 GAME_NAME = "bomberboy"
 FONT_SIZE = 30
 MAX_FPS = 200
@@ -36,6 +38,12 @@ UNIT_SELF = 15
 UNIT_ENEMY = 16
 NUM_UNITS = 17
 
+# Lookup table indexed by map unit, True for units which block characters
+OBSTACLE_LUT = np.zeros(NUM_UNITS, dtype=bool)
+OBSTACLE_LUT[[UNIT_BLOCK, UNIT_FIXED_BLOCK, UNIT_POWERUP_FIRE_HIDE,
+              UNIT_POWERUP_VELOCITY_HIDE, UNIT_POWERUP_BOMB_HIDE,
+              UNIT_DESTROYING_BLOCK]] = True
+
 # Colors
 RED = (227, 38, 54)
 BLUE = (117, 218, 255)
@@ -1,4 +1,4 @@
-from pygame import Surface
+from pygame import Rect, Surface
 
 
 class SurfaceStub(Surface):
@@ -7,4 +7,6 @@ class SurfaceStub(Surface):
         pass
 
     def blit(self, source, dest, area=None, special_flags=0):
-        pass
+        # Returns the area that would be drawn, as pygame does, since game
+        # objects report it as a dirty rect
+        return Rect(dest, source.get_size())